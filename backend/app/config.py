@@ -9,6 +9,9 @@ class Settings(BaseSettings):
 
     DEBUG: bool = True
 
+    # Bulk room export/import is disabled unless a token is configured
+    ROOM_TRANSFER_TOKEN: str = ""
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from app.database import get_db
-from app.services.room_service import RoomService
+from app.config import settings
+from app.database import get_db, SessionLocal
+from app.services.room_service import RoomService, RoomImporter, MAX_IMPORT_LINE_BYTES
 from app.schemas.room import RoomCreate, RoomResponse
+from typing import AsyncIterator, Optional
+import secrets
 
 router = APIRouter()
 
@@ -28,6 +34,117 @@ async def create_room(
     )
 
 
+def require_transfer_token(x_transfer_token: Optional[str] = Header(None)):
+    """Guard bulk export/import behind ROOM_TRANSFER_TOKEN"""
+    if not settings.ROOM_TRANSFER_TOKEN:
+        raise HTTPException(status_code=403, detail="Room export/import is disabled")
+    if not x_transfer_token or not secrets.compare_digest(
+        x_transfer_token, settings.ROOM_TRANSFER_TOKEN
+    ):
+        raise HTTPException(status_code=401, detail="Invalid transfer token")
+
+
+async def _iter_lines(stream) -> AsyncIterator[str]:
+    """
+    Split a streamed request body into lines without buffering it whole
+
+    Only each new chunk is scanned for newlines; the pieces of a partial
+    line are kept in a list until it completes.
+
+    Raises:
+        ValueError: If a line is longer than MAX_IMPORT_LINE_BYTES
+    """
+    parts = []
+    size = 0
+    async for chunk in stream:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            piece = chunk[start:] if end == -1 else chunk[start:end]
+            size += len(piece)
+            if size > MAX_IMPORT_LINE_BYTES:
+                raise ValueError(f"line exceeds {MAX_IMPORT_LINE_BYTES} bytes")
+            if end == -1:
+                if piece:
+                    parts.append(piece)
+                break
+            parts.append(piece)
+            yield b"".join(parts).decode("utf-8")
+            parts = []
+            size = 0
+            start = end + 1
+    if parts:
+        yield b"".join(parts).decode("utf-8")
+
+
+@router.get("/rooms/export", dependencies=[Depends(require_transfer_token)])
+async def export_rooms():
+    """
+    Stream every room as NDJSON (one JSON object per line)
+
+    Returns:
+        Chunked application/x-ndjson response
+    """
+    def generate():
+        # The session must outlive the request handler, so the generator owns it
+        db = SessionLocal()
+        try:
+            yield from RoomService.export_rooms(db)
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=rooms.ndjson"}
+    )
+
+
+@router.post("/rooms/import", dependencies=[Depends(require_transfer_token)])
+async def import_rooms(
+    request: Request,
+    skip_existing: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    Import rooms from an NDJSON request body
+
+    The body is consumed as a stream and written in batched inserts, each
+    run in the threadpool so the event loop stays responsive.
+
+    Args:
+        skip_existing: Ignore rooms whose id already exists
+
+    Returns:
+        Number of rooms imported
+    """
+    try:
+        importer = RoomImporter(db, skip_existing=skip_existing)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        async for line in _iter_lines(request.stream()):
+            if importer.add_line(line):
+                await run_in_threadpool(importer.flush)
+        await run_in_threadpool(importer.flush)
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid room record ({e}); {importer.imported} rooms imported"
+        )
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"Room already exists; {importer.imported} rooms imported before "
+                   f"conflict. Retry with skip_existing=true to resume"
+        )
+
+    return {"imported": importer.imported}
+
+
 @router.get("/rooms/{room_id}", response_model=RoomResponse)
 async def get_room(
     room_id: str,
@@ -1,4 +1,4 @@
-from app.services.room_service import RoomService
+from app.services.room_service import RoomService, RoomImporter
 from app.services.autocomplete_service import AutocompleteService
 
-__all__ = ["RoomService", "AutocompleteService"]
+__all__ = ["RoomService", "RoomImporter", "AutocompleteService"]
@@ -1,8 +1,29 @@
+from sqlalchemy import select, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from app.models.room import Room
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import json
 import uuid
 
+ROOM_FIELDS = ("id", "code", "language", "created_at", "updated_at", "active_users")
+EXPORT_BATCH_SIZE = 1000
+IMPORT_BATCH_SIZE = 1000
+MAX_IMPORT_LINE_BYTES = 16 * 1024 * 1024
+SKIP_EXISTING_DIALECTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def _to_utc(value: datetime) -> datetime:
+    """Normalize a timestamp to aware UTC, treating naive values as UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
 
 class RoomService:
     """Service for managing rooms and code state"""
@@ -55,3 +76,204 @@ class RoomService:
             db.commit()
             db.refresh(room)
         return room
+
+    @staticmethod
+    def export_rooms(db: Session, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+        """
+        Stream all rooms as NDJSON, one room per line
+
+        Rows are fetched as plain tuples through a server-side cursor in
+        batches of ``batch_size``, so memory stays flat regardless of the
+        number of rooms.
+
+        Yields:
+            One NDJSON chunk per fetched batch
+        """
+        stmt = (
+            select(*(getattr(Room, name) for name in ROOM_FIELDS))
+            .order_by(Room.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = db.execute(stmt)
+        for partition in result.partitions():
+            yield "".join(
+                json.dumps(RoomService._row_to_record(row)) + "\n"
+                for row in partition
+            )
+
+    @staticmethod
+    def _row_to_record(row) -> Dict[str, Any]:
+        """Convert an exported row into a JSON-serializable dict"""
+        record = dict(row._mapping)
+        for key in ("created_at", "updated_at"):
+            if record[key] is not None:
+                record[key] = _to_utc(record[key]).isoformat()
+        return record
+
+    @staticmethod
+    def parse_room_record(line: str) -> Dict[str, Any]:
+        """
+        Parse one NDJSON line into insertable room values
+
+        ``active_users`` is a live connection counter, so imported rooms
+        always start at 0. Timestamps are converted to UTC; naive values
+        are taken to be UTC already.
+
+        Raises:
+            ValueError: If the line is not a valid room record
+        """
+        data = json.loads(line)
+        if not isinstance(data, dict):
+            raise ValueError("Room record must be a JSON object")
+        if not isinstance(data.get("id"), str) or not data["id"]:
+            raise ValueError("Room 'id' must be a non-empty string")
+        for key in ("code", "language", "created_at", "updated_at"):
+            if data.get(key) is not None and not isinstance(data[key], str):
+                raise ValueError(f"Room '{key}' must be a string")
+        active_users = data.get("active_users")
+        if active_users is not None and (
+            not isinstance(active_users, int) or isinstance(active_users, bool)
+        ):
+            raise ValueError("Room 'active_users' must be an integer")
+
+        record = {
+            "id": data["id"],
+            "code": data.get("code") or "",
+            "language": data.get("language") or "python",
+            "active_users": 0,
+        }
+        for key in ("created_at", "updated_at"):
+            value = data.get(key)
+            record[key] = _to_utc(datetime.fromisoformat(value)) if value is not None else None
+        return record
+
+    @staticmethod
+    def insert_rooms(
+        db: Session,
+        records: List[Dict[str, Any]],
+        skip_existing: bool = False
+    ) -> int:
+        """
+        Insert a batch of parsed room records in a single executemany
+
+        With ``skip_existing``, rooms whose id is already present are left
+        untouched (ON CONFLICT DO NOTHING / INSERT OR IGNORE), which makes
+        re-running an interrupted import safe.
+
+        Returns:
+            Number of rooms written
+
+        Raises:
+            ValueError: If ``skip_existing`` is not supported by the database
+        """
+        if not records:
+            return 0
+        if not skip_existing:
+            db.connection().execute(insert(Room), records)
+            db.commit()
+            return len(records)
+
+        dialect_insert = RoomService._skip_existing_insert(db)
+        # executemany rowcount is not summed across insertmanyvalues pages,
+        # so count the ids the database actually wrote instead
+        stmt = (
+            dialect_insert(Room)
+            .on_conflict_do_nothing(index_elements=["id"])
+            .returning(Room.id)
+        )
+        inserted = len(db.connection().execute(stmt, records).all())
+        db.commit()
+        return inserted
+
+    @staticmethod
+    def _skip_existing_insert(db: Session):
+        """
+        Get the dialect insert construct that supports ON CONFLICT DO NOTHING
+
+        Raises:
+            ValueError: If the database dialect has no such construct
+        """
+        dialect = db.get_bind().dialect.name
+        if dialect not in SKIP_EXISTING_DIALECTS:
+            raise ValueError(f"skip_existing is not supported on {dialect}")
+        return SKIP_EXISTING_DIALECTS[dialect]
+
+    @staticmethod
+    def import_rooms(
+        db: Session,
+        lines: Iterable[str],
+        batch_size: int = IMPORT_BATCH_SIZE,
+        skip_existing: bool = False
+    ) -> int:
+        """
+        Import rooms from NDJSON lines using batched inserts
+
+        Returns:
+            Number of rooms imported
+        """
+        importer = RoomImporter(db, batch_size=batch_size, skip_existing=skip_existing)
+        importer.import_lines(lines)
+        return importer.imported
+
+
+class RoomImporter:
+    """
+    Batches NDJSON room lines into bulk inserts
+
+    Each batch is committed as it is written, so only ``batch_size`` records
+    are held in memory at a time. Callers that cannot block (the HTTP
+    endpoint) drive ``add_line``/``flush`` themselves; everything else uses
+    ``import_lines``.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        skip_existing: bool = False
+    ):
+        """
+        Raises:
+            ValueError: If ``skip_existing`` is not supported by the database
+        """
+        if skip_existing:
+            RoomService._skip_existing_insert(db)
+        self.db = db
+        self.batch_size = batch_size
+        self.skip_existing = skip_existing
+        self.imported = 0
+        self.line_number = 0
+        self._batch: List[Dict[str, Any]] = []
+
+    def add_line(self, line: str) -> bool:
+        """
+        Parse and queue one line
+
+        Returns:
+            True once a full batch is ready to be flushed
+
+        Raises:
+            ValueError: If the line is not a valid room record
+        """
+        self.line_number += 1
+        if not line.strip():
+            return False
+        try:
+            self._batch.append(RoomService.parse_room_record(line))
+        except ValueError as e:
+            raise ValueError(f"line {self.line_number}: {e}") from e
+        return len(self._batch) >= self.batch_size
+
+    def flush(self) -> int:
+        """Insert and commit the queued batch"""
+        batch, self._batch = self._batch, []
+        inserted = RoomService.insert_rooms(self.db, batch, skip_existing=self.skip_existing)
+        self.imported += inserted
+        return inserted
+
+    def import_lines(self, lines: Iterable[str]) -> None:
+        """Import every line, flushing full batches as they fill"""
+        for line in lines:
+            if self.add_line(line):
+                self.flush()
+        self.flush()
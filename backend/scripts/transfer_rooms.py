@@ -0,0 +1,105 @@
+"""
+Room export/import script
+Streams rooms to or from NDJSON for backup and migration between databases
+
+Usage:
+    python scripts/transfer_rooms.py export --output rooms.ndjson
+    python scripts/transfer_rooms.py import --input rooms.ndjson --database-url postgresql://...
+    python scripts/transfer_rooms.py import --input rooms.ndjson --skip-existing  # resume
+"""
+import argparse
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from app.config import settings
+from app.database import Base
+from app.services.room_service import RoomService, RoomImporter, EXPORT_BATCH_SIZE, IMPORT_BATCH_SIZE
+
+
+def make_session(database_url):
+    """Create a session bound to the given database URL"""
+    engine = create_engine(
+        database_url,
+        connect_args={"check_same_thread": False} if "sqlite" in database_url else {}
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+
+def export_rooms(db, output, batch_size):
+    """Write every room to output as NDJSON"""
+    for chunk in RoomService.export_rooms(db, batch_size=batch_size):
+        output.write(chunk)
+
+
+def import_rooms(db, input_file, batch_size, skip_existing):
+    """
+    Read NDJSON rooms from input_file and insert them in batches
+
+    Returns:
+        True if every line was imported
+    """
+    try:
+        importer = RoomImporter(db, batch_size=batch_size, skip_existing=skip_existing)
+    except ValueError as e:
+        print(f"Cannot import: {e}", file=sys.stderr)
+        return False
+
+    try:
+        importer.import_lines(input_file)
+    except IntegrityError:
+        db.rollback()
+        print(f"Room already exists; imported {importer.imported} rooms before the conflict. "
+              f"Re-run with --skip-existing to resume.", file=sys.stderr)
+        return False
+    except ValueError as e:
+        db.rollback()
+        print(f"Invalid room record ({e}); imported {importer.imported} rooms.", file=sys.stderr)
+        return False
+    print(f"Imported {importer.imported} rooms", file=sys.stderr)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export or import rooms as NDJSON")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL,
+                        help="Database to read from or write to (defaults to DATABASE_URL)")
+    parser.add_argument("--output", help="Export file (defaults to stdout)")
+    parser.add_argument("--input", help="Import file (defaults to stdin)")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="Rows per fetch/insert batch")
+    parser.add_argument("--skip-existing", action="store_true",
+                        help="On import, ignore rooms whose id already exists")
+    args = parser.parse_args()
+
+    db = make_session(args.database_url)
+    try:
+        if args.command == "export":
+            batch_size = args.batch_size or EXPORT_BATCH_SIZE
+            if args.output:
+                with open(args.output, "w", encoding="utf-8") as output:
+                    export_rooms(db, output, batch_size)
+                print(f"Rooms exported to {args.output}", file=sys.stderr)
+            else:
+                export_rooms(db, sys.stdout, batch_size)
+        else:
+            batch_size = args.batch_size or IMPORT_BATCH_SIZE
+            if args.input:
+                with open(args.input, "r", encoding="utf-8") as input_file:
+                    if not import_rooms(db, input_file, batch_size, args.skip_existing):
+                        return 1
+            elif not import_rooms(db, sys.stdin, batch_size, args.skip_existing):
+                return 1
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
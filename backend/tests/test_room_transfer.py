@@ -0,0 +1,274 @@
+"""
+Room export/import tests
+Runs against temporary SQLite databases; requires pytest and httpx
+"""
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.config import settings
+from app.database import Base, get_db
+from app.main import app
+from app.models import Room
+from app.routers import rooms as rooms_router
+from app.services import room_service
+from app.services.room_service import RoomService
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'transfer_rooms.py')
+TOKEN = "test-transfer-token"
+
+
+def make_sessionmaker(path):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def seed_rooms(db, count):
+    for i in range(count):
+        db.add(Room(id=f"room-{i}", code=f"print({i})\n", language="python", active_users=i))
+    db.commit()
+
+
+def room_rows(db):
+    return [
+        (room.id, room.code, room.language, room.created_at, room.active_users)
+        for room in db.query(Room).order_by(Room.id)
+    ]
+
+
+@pytest.fixture
+def source(tmp_path):
+    db = make_sessionmaker(tmp_path / "source.db")()
+    seed_rooms(db, 5)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def target_factory(tmp_path):
+    return make_sessionmaker(tmp_path / "target.db")
+
+
+@pytest.fixture
+def client(target_factory, monkeypatch):
+    def override_get_db():
+        db = target_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(settings, "ROOM_TRANSFER_TOKEN", TOKEN)
+    monkeypatch.setattr(rooms_router, "SessionLocal", target_factory)
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def export_ndjson(db):
+    return "".join(RoomService.export_rooms(db, batch_size=2))
+
+
+def test_round_trip_in_small_batches(source, target_factory):
+    target = target_factory()
+    imported = RoomService.import_rooms(
+        target, export_ndjson(source).splitlines(keepends=True), batch_size=2
+    )
+
+    assert imported == 5
+    expected = [row[:4] + (0,) for row in room_rows(source)]
+    assert room_rows(target) == expected
+    target.close()
+
+
+@pytest.mark.parametrize("line", [
+    "not json",
+    '["a list"]',
+    '{"code": "no id"}',
+    '{"id": 5}',
+    '{"id": "x", "created_at": 5}',
+    '{"id": "x", "created_at": "yesterday"}',
+    '{"id": "x", "active_users": "abc"}',
+    '{"id": "x", "language": ["python"]}',
+])
+def test_parse_room_record_rejects_invalid(line):
+    with pytest.raises(ValueError):
+        RoomService.parse_room_record(line)
+
+
+def test_skip_existing_resumes_import(source, target_factory):
+    lines = export_ndjson(source).splitlines(keepends=True)
+    target = target_factory()
+    RoomService.import_rooms(target, lines[:3], batch_size=2)
+
+    imported = RoomService.import_rooms(target, lines, batch_size=2, skip_existing=True)
+
+    assert imported == 2
+    assert len(room_rows(target)) == 5
+    target.close()
+
+
+def test_timestamps_are_normalized_to_utc(target_factory):
+    target = target_factory()
+    lines = [
+        '{"id": "offset", "created_at": "2025-12-03T10:00:00+02:00"}\n',
+        '{"id": "naive", "created_at": "2025-12-03T10:00:00"}\n',
+    ]
+    RoomService.import_rooms(target, lines)
+
+    assert [row[3] for row in room_rows(target)] == [
+        datetime(2025, 12, 3, 10, 0), datetime(2025, 12, 3, 8, 0)
+    ]
+    exported = [json.loads(line) for line in export_ndjson(target).splitlines()]
+    assert [room["created_at"] for room in exported] == [
+        "2025-12-03T10:00:00+00:00", "2025-12-03T08:00:00+00:00"
+    ]
+    target.close()
+
+
+def test_skip_existing_counts_across_insert_pages(target_factory):
+    target = target_factory()
+    lines = [f'{{"id": "room-{i:04d}"}}\n' for i in range(2500)]
+    RoomService.import_rooms(target, lines[:600])
+
+    imported = RoomService.import_rooms(target, lines, batch_size=2500, skip_existing=True)
+
+    assert imported == 1900
+    target.close()
+
+
+def test_skip_existing_unsupported_dialect(target_factory, monkeypatch):
+    monkeypatch.delitem(room_service.SKIP_EXISTING_DIALECTS, "sqlite")
+    target = target_factory()
+
+    with pytest.raises(ValueError):
+        RoomService.import_rooms(target, ['{"id": "x"}\n'], skip_existing=True)
+    target.close()
+
+
+def test_endpoints_disabled_without_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "ROOM_TRANSFER_TOKEN", "")
+
+    assert client.get("/api/rooms/export").status_code == 403
+    assert client.post("/api/rooms/import", content="").status_code == 403
+
+
+def test_endpoints_reject_wrong_token(client):
+    headers = {"X-Transfer-Token": "wrong"}
+
+    assert client.get("/api/rooms/export", headers=headers).status_code == 401
+    assert client.post("/api/rooms/import", content="", headers=headers).status_code == 401
+
+
+def test_http_import_then_export(source, client):
+    headers = {"X-Transfer-Token": TOKEN}
+    body = export_ndjson(source)
+
+    response = client.post("/api/rooms/import", content=body, headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"imported": 5}
+
+    response = client.get("/api/rooms/export", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.text.splitlines() == [
+        line.replace(f'"active_users": {i}', '"active_users": 0')
+        for i, line in enumerate(body.splitlines())
+    ]
+
+
+def test_http_import_malformed_line(client):
+    body = '{"id": "ok"}\n{"id": "y", "created_at": 5}\n'
+
+    response = client.post(
+        "/api/rooms/import", content=body, headers={"X-Transfer-Token": TOKEN}
+    )
+
+    assert response.status_code == 400
+    assert "line 2" in response.json()["detail"]
+
+
+def test_http_import_duplicate_id(source, client):
+    headers = {"X-Transfer-Token": TOKEN}
+    body = export_ndjson(source)
+    client.post("/api/rooms/import", content=body, headers=headers)
+
+    response = client.post("/api/rooms/import", content=body, headers=headers)
+    assert response.status_code == 409
+
+    response = client.post(
+        "/api/rooms/import", params={"skip_existing": "true"}, content=body, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json() == {"imported": 0}
+
+
+def test_http_import_small_chunks(source, client):
+    body = export_ndjson(source).encode("utf-8")
+    chunks = (body[i:i + 7] for i in range(0, len(body), 7))
+
+    response = client.post(
+        "/api/rooms/import", content=chunks, headers={"X-Transfer-Token": TOKEN}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"imported": 5}
+
+
+def test_http_import_line_too_long(client, monkeypatch):
+    monkeypatch.setattr(rooms_router, "MAX_IMPORT_LINE_BYTES", 32)
+    body = '{"id": "ok"}\n{"id": "long", "code": "' + "x" * 64 + '"}\n'
+
+    response = client.post(
+        "/api/rooms/import", content=body, headers={"X-Transfer-Token": TOKEN}
+    )
+
+    assert response.status_code == 400
+    assert "exceeds 32 bytes" in response.json()["detail"]
+
+
+def test_http_skip_existing_unsupported_dialect(client, monkeypatch):
+    monkeypatch.delitem(room_service.SKIP_EXISTING_DIALECTS, "sqlite")
+
+    response = client.post(
+        "/api/rooms/import", params={"skip_existing": "true"}, content="",
+        headers={"X-Transfer-Token": TOKEN}
+    )
+
+    assert response.status_code == 400
+    assert "not supported on sqlite" in response.json()["detail"]
+
+
+def test_cli_round_trip_and_resume(source, tmp_path):
+    dump = tmp_path / "rooms.ndjson"
+    source_url = f"sqlite:///{tmp_path / 'source.db'}"
+    target_url = f"sqlite:///{tmp_path / 'cli_target.db'}"
+
+    def run(*args):
+        return subprocess.run(
+            [sys.executable, SCRIPT, *args], capture_output=True, text=True
+        )
+
+    assert run("export", "--database-url", source_url, "--output", str(dump)).returncode == 0
+    result = run("import", "--database-url", target_url, "--input", str(dump), "--batch-size", "2")
+    assert result.returncode == 0
+    assert "Imported 5 rooms" in result.stderr
+
+    result = run("import", "--database-url", target_url, "--input", str(dump))
+    assert result.returncode == 1
+    assert "--skip-existing" in result.stderr
+    assert "Traceback" not in result.stderr
+
+    result = run("import", "--database-url", target_url, "--input", str(dump), "--skip-existing")
+    assert result.returncode == 0
+    assert "Imported 0 rooms" in result.stderr